@@ -1,23 +1,24 @@
 from dataclasses import dataclass
-from typing import List, Union
+from functools import cached_property
+from typing import Dict, List, Union
 
-@dataclass
+@dataclass(slots=True)
 class ComponentDeclaration:
     type: str
     name: str
     value: float
     unit: str
 
-@dataclass
+@dataclass(slots=True)
 class ComponentTerminal:
     component: str
     terminal: str
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     endpoints: List[Union[ComponentTerminal, str]]  # component terminal or literal node/ground
 
-@dataclass
+@dataclass(slots=True)
 class SimulationCommand:
     type: str
     parameters: List[Union[float, str]]
@@ -39,3 +40,8 @@ class Program:
     connections: List[Connection]
     simulations: List[SimulationBlock]
     subcircuits: List[Subcircuit]
+
+    @cached_property
+    def subcircuit_index(self) -> Dict[str, Subcircuit]:
+        # name -> definition, built on first use
+        return {sub.name: sub for sub in self.subcircuits}
@@ -1,5 +1,6 @@
 from flask import Flask, render_template, jsonify, request
 import json
+from functools import lru_cache
 from main import draw_circuit
 from lexer import Lexer
 from parser import Parser
@@ -19,10 +20,10 @@ class InteractiveVisualizer:
         
     def add_component(self, component):
         comp_dict = {
-            'id': getattr(component, 'name', ''),
-            'type': getattr(component, 'type', ''),
-            'value': getattr(component, 'value', 0),
-            'unit': getattr(component, 'unit', ''),
+            'id': component.name,
+            'type': component.type,
+            'value': component.value,
+            'unit': component.unit,
             'position': {'x': 0, 'y': 0}
         }
         self.components.append(comp_dict)
@@ -83,17 +84,42 @@ class InteractiveVisualizer:
 def get_subcircuit_pins(subckt: Subcircuit):
     # Find all node names used in Connect inside the subcircuit that are not component terminals
     pins = set()
+    has_ground = False
     for conn in subckt.connections:
         for ep in conn.endpoints:
-            if isinstance(ep, str) and ep not in ('ground',):
-                pins.add(ep)
+            if isinstance(ep, str):
+                if ep == 'ground':
+                    has_ground = True
+                else:
+                    pins.add(ep)
     # Always include 'ground' if used
-    for conn in subckt.connections:
-        for ep in conn.endpoints:
-            if isinstance(ep, str) and ep == 'ground':
-                pins.add('ground')
+    if has_ground:
+        pins.add('ground')
     return list(pins)
 
+@lru_cache(maxsize=128)
+def parse_program(code: str) -> Program:
+    # The editor re-posts unchanged code often; reuse the AST for identical source.
+    # Callers must treat the returned Program as read-only.
+    tokens = Lexer(code).tokenize()
+    return Parser(tokens).parse()
+
+@lru_cache(maxsize=128)
+def program_netlist(code: str) -> tuple:
+    # Netlist for the cached Program, kept as a tuple so the shared copy stays read-only
+    return tuple(Interpreter(parse_program(code)).generate_netlist())
+
+def split_endpoint(ep):
+    # Map a connection endpoint to a (component, terminal) pair for the visualizer
+    if isinstance(ep, ComponentTerminal):
+        # If hierarchical (e.g., D1.input), treat as (D1, input)
+        instance, dot, rest = ep.component.partition('.')
+        if dot:
+            return instance, rest.rpartition('.')[2]  # (instance, pin)
+        return ep.component, ep.terminal
+    else:
+        return ep, 'node'
+
 @app.route('/')
 def index():
     try:
@@ -107,15 +133,17 @@ def index():
 def parse_dsl():
     code = request.json.get('code', '')
     try:
-        tokens = Lexer(code).tokenize()
-        program = Parser(tokens).parse()
+        program = parse_program(code)
         visualizer = InteractiveVisualizer()
-        # Map subcircuit name to Subcircuit object
-        subckt_defs = {sub.name: sub for sub in program.subcircuits}
+        subckt_defs = program.subcircuit_index
+        # Pins only depend on the definition, so compute them once per subcircuit type
+        subckt_pins = {}
         # Add subcircuit instances and regular components
         for comp in program.components:
             if comp.type in subckt_defs:
-                pins = get_subcircuit_pins(subckt_defs[comp.type])
+                pins = subckt_pins.get(comp.type)
+                if pins is None:
+                    pins = subckt_pins[comp.type] = get_subcircuit_pins(subckt_defs[comp.type])
                 visualizer.add_subcircuit_instance(comp.name, comp.type, pins)
             else:
                 visualizer.add_component(comp)
@@ -124,43 +152,27 @@ def parse_dsl():
             endpoints = conn.endpoints
             if len(endpoints) == 2:
                 ep1, ep2 = endpoints
-                # If endpoint is subcircuit pin, connect to subcircuit instance and pin
-                def parse_ep(ep):
-                    if isinstance(ep, ComponentTerminal):
-                        # If hierarchical (e.g., D1.input), treat as (D1, input)
-                        if '.' in ep.component:
-                            parts = ep.component.split('.')
-                            return parts[0], parts[-1]  # (instance, pin)
-                        else:
-                            return ep.component, ep.terminal
-                    else:
-                        return ep, 'node'
-                from_comp, from_term = parse_ep(ep1)
-                to_comp, to_term = parse_ep(ep2)
+                from_comp, from_term = split_endpoint(ep1)
+                to_comp, to_term = split_endpoint(ep2)
                 visualizer.add_connection(from_comp, from_term, to_comp, to_term)
         visualizer.generate_layout()
         return jsonify(visualizer.to_json())
     except Exception as e:
-        # Try to extract line/column info if present in the error message
-        import traceback
-        tb = traceback.format_exc()
+        # SyntaxError messages carry line/column info, which the editor highlights
         err_msg = str(e)
-        # If the error is a SyntaxError with line/column, keep that
         return jsonify({'error': err_msg}), 200
 
 @app.route('/generate-dsl', methods=['POST'])
 def generate_dsl():
     data = request.json
-    lines = []
-    for comp in data.get('components', []):
-        lines.append(f"{comp['type']} {comp['id']}({comp['value']} {comp['unit']});")
-    for subckt in data.get('subcircuits', []):
-        lines.append(f"{subckt['type']} {subckt['id']};")
-    for conn in data.get('connections', []):
-        if conn['to_term'] == 'node':
-            lines.append(f"Connect({conn['from']}.{conn['from_term']}, {conn['to']});")
-        else:
-            lines.append(f"Connect({conn['from']}.{conn['from_term']}, {conn['to']}.{conn['to_term']});")
+    lines = [f"{comp['type']} {comp['id']}({comp['value']} {comp['unit']});"
+             for comp in data.get('components', [])]
+    lines += [f"{subckt['type']} {subckt['id']};" for subckt in data.get('subcircuits', [])]
+    lines += [
+        f"Connect({conn['from']}.{conn['from_term']}, {conn['to']});" if conn['to_term'] == 'node'
+        else f"Connect({conn['from']}.{conn['from_term']}, {conn['to']}.{conn['to_term']});"
+        for conn in data.get('connections', [])
+    ]
     code = '\n'.join(lines)
     return jsonify({'code': code})
 
@@ -168,15 +180,13 @@ def generate_dsl():
 def simulate_dsl():
     code = request.json.get('code', '')
     try:
-        tokens = Lexer(code).tokenize()
-        program = Parser(tokens).parse()
+        program = parse_program(code)
         # Check for Simulate block
         if not program.simulations or len(program.simulations) == 0:
             return jsonify({'error': 'No Simulate block found. Please add Simulate { dc; };'}), 200
 
         # Run simulation logic: generate netlist
-        interp = Interpreter(program)
-        netlist_lines = interp.generate_netlist()
+        netlist_lines = program_netlist(code)
 
         # --- Basic DC Operating Point Analysis (Ohm's Law) ---
         output_message = 'Simulation Netlist:\n' + '\n'.join(netlist_lines)
@@ -234,10 +244,9 @@ def simulate_dsl():
 
         return jsonify({'output': output_message})
     except Exception as e:
-        import traceback
-        tb = traceback.format_exc()
         err_msg = str(e)
         return jsonify({'error': err_msg}), 200
 
 if __name__ == '__main__':
-    app.run(debug=True) 
\ No newline at end of file
+    # The reloader and debugger add per-request overhead; opt in with FLASK_DEBUG=1
+    app.run() 
\ No newline at end of file
@@ -1,49 +1,111 @@
 from typing import Dict, List
 from ast_nodes import *
 
+def _format_op(cmd: SimulationCommand) -> str:
+    return '.OP'
+
+def _format_tran(cmd: SimulationCommand) -> str:
+    start, stop, step = cmd.parameters
+    return f".TRAN {step} {stop} {start}"
+
+def _format_ac(cmd: SimulationCommand) -> str:
+    params = ' '.join(str(p) for p in cmd.parameters)
+    return f".AC {params}"
+
+# simulation keyword -> SPICE control line formatter
+SIM_FORMATTERS = {
+    'dc': _format_op,
+    'transient': _format_tran,
+    'ac': _format_ac,
+}
+
 class Interpreter:
     def __init__(self, program: Program):
         self.program = program
         self.node_counter = 1
         self.node_name_to_id: Dict[str, int] = {}
         self.terminal_map: Dict[str, Dict[str, int]] = {}
+        # Union-Find forest over endpoint ids, filled by build_node_mapping
+        self.parent: List[int] = []
+        self.rank: List[int] = []
 
     def build_node_mapping(self):
+        if self.parent:
+            # already built for this program; the AST is not modified afterwards
+            return
+        # Union-Find over endpoints: id 0 is ground, every other node name and
+        # (component, terminal) pair gets a dense id on first sight
+        self.parent = [0]
+        self.rank = [0]
+        endpoint_ids: Dict[object, int] = {'ground': 0}
+        conn_ids: List[List[int]] = []
         for conn in self.program.connections:
-            endpoints = conn.endpoints
-            # ground has node 0
-            if any(ep == 'ground' for ep in endpoints):
-                nid = 0
-            else:
-                literals = [ep for ep in endpoints if isinstance(ep, str) and ep != 'ground']
-                nid = None
-                for name in literals:
-                    if name in self.node_name_to_id:
-                        nid = self.node_name_to_id[name]
-                        break
-                if nid is None:
-                    nid = self.node_counter
-                    self.node_counter += 1
-                for name in literals:
-                    self.node_name_to_id[name] = nid
-            for ep in endpoints:
+            ids = []
+            for ep in conn.endpoints:
+                key = (ep.component, ep.terminal) if isinstance(ep, ComponentTerminal) else ep
+                eid = endpoint_ids.get(key)
+                if eid is None:
+                    eid = endpoint_ids[key] = len(self.parent)
+                    self.parent.append(eid)
+                    self.rank.append(0)
+                ids.append(eid)
+            for eid in ids[1:]:
+                self._union(ids[0], eid)
+            conn_ids.append(ids)
+        # number nets in order of first appearance, ground stays 0
+        ground = self._find(0)
+        net_ids = {ground: 0}
+        self.node_counter = 1
+        for conn, ids in zip(self.program.connections, conn_ids):
+            root = self._find(ids[0])
+            nid = net_ids.get(root)
+            if nid is None:
+                nid = net_ids[root] = self.node_counter
+                self.node_counter += 1
+            for ep in conn.endpoints:
                 if isinstance(ep, ComponentTerminal):
                     self.terminal_map.setdefault(ep.component, {})[ep.terminal] = nid
+                elif ep != 'ground':
+                    self.node_name_to_id[ep] = nid
+
+    def _find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def _union(self, a: int, b: int):
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
 
     def generate_netlist(self) -> List[str]:
         self.build_node_mapping()
         lines: List[str] = []
+        terminal_map = self.terminal_map
         for comp in self.program.components:
-            term_map = self.terminal_map.get(comp.name, {})
-            n_plus  = term_map.get('positive', 0)
-            n_minus = term_map.get('negative', 0)
+            term_map = terminal_map.get(comp.name)
+            if term_map is None:
+                # unconnected component: both terminals default to ground
+                n_plus = n_minus = 0
+            else:
+                n_plus  = term_map.get('positive', 0)
+                n_minus = term_map.get('negative', 0)
             lines.append(f"{comp.name} {n_plus} {n_minus} {comp.value}{comp.unit}")
         for sub in self.program.subcircuits:
             lines.append(f".SUBCKT {sub.name}")
             subprog = Program(sub.components, sub.connections, sub.simulations, [])
             sub_interp = Interpreter(subprog)
-            for line in sub_interp.generate_netlist():
-                lines.append(f"  {line}")
+            lines.extend(f"  {line}" for line in sub_interp.generate_netlist())
             lines.append(f".ENDS {sub.name}")
         for sim in self.program.simulations:
             for cmd in sim.commands:
@@ -51,16 +113,10 @@ class Interpreter:
         return lines
 
     def _format_sim(self, cmd: SimulationCommand) -> str:
-        typ = cmd.type.lower()
-        if typ == 'dc':
-            return '.OP'
-        if typ == 'transient':
-            start, stop, step = cmd.parameters
-            return f".TRAN {step} {stop} {start}"
-        if typ == 'ac':
-            params = ' '.join(str(p) for p in cmd.parameters)
-            return f".AC {params}"
-        return f".{cmd.type.upper()} {' '.join(str(p) for p in cmd.parameters)}"
+        formatter = SIM_FORMATTERS.get(cmd.type.lower())
+        if formatter is None:
+            return f".{cmd.type.upper()} {' '.join(str(p) for p in cmd.parameters)}"
+        return formatter(cmd)
 
     def run(self):
         for line in self.generate_netlist():
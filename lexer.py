@@ -1,4 +1,5 @@
 import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import List
@@ -10,7 +11,13 @@ class TokenType(Enum):
     CONNECT       = auto()
     SUBCIRCUIT    = auto()
     SIMULATE      = auto()
-    SYMBOL        = auto()
+    LPAREN        = auto()
+    RPAREN        = auto()
+    LBRACE        = auto()
+    RBRACE        = auto()
+    COMMA         = auto()
+    SEMICOLON     = auto()
+    DOT           = auto()
     OPERATOR      = auto()
     LAW           = auto()
     WIRE          = auto()
@@ -20,29 +27,40 @@ class TokenType(Enum):
     KEYWORD       = auto()
     EOF           = auto()
 
+# Reserved words are matched as IDENTIFIER and then promoted by lookup
+KEYWORDS = {
+    **dict.fromkeys(('Resistor', 'Capacitor', 'Inductor', 'VoltageSource', 'CurrentSource', 'Ammeter'),
+                    TokenType.COMPONENT),
+    'Wire':       TokenType.WIRE,
+    'Connect':    TokenType.CONNECT,
+    'Subcircuit': TokenType.SUBCIRCUIT,
+    'Simulate':   TokenType.SIMULATE,
+    **dict.fromkeys(('OhmLaw', 'KCL', 'KVL'), TokenType.LAW),
+    'ground':     TokenType.GROUND,
+    'node':       TokenType.NODE,
+    **dict.fromkeys(('dc', 'transient', 'ac'), TokenType.KEYWORD),
+    **dict.fromkeys(('ohm', 'uF', 'mH', 'H', 'V', 'A', 'mA', 'kOhm'), TokenType.UNIT),
+}
+
 # Token regex specification
 TOKEN_SPECIFICATION = [
-    ('COMPONENT',  r'\b(?:Resistor|Capacitor|Inductor|VoltageSource|CurrentSource|Ammeter)\b'),
-    ('WIRE',       r'\bWire\b'),
-    ('CONNECT',    r'\bConnect\b'),
-    ('SUBCIRCUIT', r'\bSubcircuit\b'),
-    ('SIMULATE',   r'\bSimulate\b'),
-    ('LAW',        r'\b(?:OhmLaw|KCL|KVL)\b'),
-    ('GROUND',     r'\bground\b'),
-    ('NODE',       r'\bnode\b'),
-    ('KEYWORD',    r'\b(?:dc|transient|ac)\b'),
-    ('UNIT',       r'\b(?:ohm|uF|mH|H|V|A|mA|kOhm)\b'),
     ('NUMBER',     r'\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'),
     ('IDENTIFIER', r'[A-Za-z_][A-Za-z0-9_]*'),
     ('OPERATOR',   r'[+\-*/=]'),
-    ('SYMBOL',     r'[(),;{}\.\}]'),
+    ('LPAREN',     r'\('),
+    ('RPAREN',     r'\)'),
+    ('LBRACE',     r'\{'),
+    ('RBRACE',     r'\}'),
+    ('COMMA',      r','),
+    ('SEMICOLON',  r';'),
+    ('DOT',        r'\.'),
     ('SKIP',       r'[ \t\r\n]+'),
     ('MISMATCH',   r'.'),
 ]
 _master_regex = '|'.join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPECIFICATION)
 _token_re = re.compile(_master_regex)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Token:
     type: TokenType
     value: str
@@ -55,29 +73,38 @@ class Lexer:
 
     def tokenize(self) -> List[Token]:
         tokens: List[Token] = []
+        # local aliases for names used once per token
+        append = tokens.append
+        intern = sys.intern
+        keyword_type = KEYWORDS.get
+        token_types = TokenType.__members__
+        identifier = TokenType.IDENTIFIER
         line = 1
-        col = 1
-        pos = 0
+        line_start = 0
+        # position just past the last real token, reported for EOF
+        end_line, end_col = 1, 1
         for mo in _token_re.finditer(self.code):
             kind = mo.lastgroup
             value = mo.group()
             start = mo.start()
-            segment = self.code[pos:start]
-            # update line/col based on skipped text
-            newlines = segment.count('\n')
-            if newlines > 0:
-                line += newlines
-                col = start - segment.rfind('\n')
-            else:
-                col += len(segment)
             if kind == 'SKIP':
-                pos = mo.end()
+                # only whitespace can span lines; track where the current line begins
+                newlines = value.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + value.rfind('\n') + 1
                 continue
+            col = start - line_start + 1
             if kind == 'MISMATCH':
                 raise SyntaxError(f"Unexpected token {value!r} at line {line}, column {col}")
-            token_type = TokenType[kind]
-            tokens.append(Token(token_type, value, line, col))
-            pos = mo.end()
-            col += len(value)
-        tokens.append(Token(TokenType.EOF, '', line, col))
+            if kind == 'IDENTIFIER':
+                # names, terminals and reserved words repeat throughout a
+                # circuit; share one string object per spelling
+                value = intern(value)
+                token_type = keyword_type(value, identifier)
+            else:
+                token_type = token_types[kind]
+            append(Token(token_type, value, line, col))
+            end_line, end_col = line, col + len(value)
+        tokens.append(Token(TokenType.EOF, '', end_line, end_col))
         return tokens
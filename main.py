@@ -2,6 +2,7 @@
 import argparse
 import sys
 import matplotlib.pyplot as plt
+import numpy as np
 
 from lexer import Lexer
 from parser import Parser
@@ -13,26 +14,44 @@ NET_SPACING = 2.0     # vertical spacing between rails
 COMP_SPACING = 2.0    # horizontal spacing between components on a rail
 SYMBOL_WIDTH = 1.0    # width reserved for each component symbol
 SYMBOL_HEIGHT = 0.6   # height reserved for each component symbol
+# Ground glyph: stem length, then the drop and half-width of its three bars
+GROUND_STEM = 0.8
+GROUND_BAR_DROPS = np.array([0.8, 1.0, 1.2])
+GROUND_BAR_HALF_WIDTHS = np.array([0.3, 0.2, 0.1])
 
 
-def build_nets(program):
+def build_nets(program, interp):
     """
     Build a mapping from net_id (int) to list of endpoints on that net.
     Each endpoint is a ComponentTerminal or the string 'ground'.
+    Reuses the node mapping of the given Interpreter for this program.
     """
-    interp = Interpreter(program)
     interp.build_node_mapping()
+    terminal_map = interp.terminal_map
     nets = {}
     for conn in program.connections:
         first = conn.endpoints[0]
         if isinstance(first, ComponentTerminal):
-            nid = interp.terminal_map[first.component][first.terminal]
+            nid = terminal_map[first.component][first.terminal]
         else:
             nid = 0
         nets.setdefault(nid, []).extend(conn.endpoints)
     return nets
 
 
+def draw_grounds(ax, xs, ys, **line_kw):
+    """
+    Draws ground glyphs hanging below every (x, y) point with one
+    vlines and one hlines call (a LineCollection each).
+    """
+    xs = np.asarray(xs, dtype=float)[:, None]
+    ys = np.asarray(ys, dtype=float)[:, None]
+    ax.vlines(xs.ravel(), ys.ravel(), (ys - GROUND_STEM).ravel(), colors='k', **line_kw)
+    ax.hlines((ys - GROUND_BAR_DROPS).ravel(),
+              (xs - GROUND_BAR_HALF_WIDTHS).ravel(),
+              (xs + GROUND_BAR_HALF_WIDTHS).ravel(), colors='k', **line_kw)
+
+
 def draw_symbol(ax, comp, x, y):
     """
     Draws a component symbol (voltage source, resistor, generic) centered at (x,y).
@@ -49,12 +68,9 @@ def draw_symbol(ax, comp, x, y):
         # zigzag resistor horizontally
         n = 6
         dx = SYMBOL_WIDTH / (n * 2)
-        pts = []
-        for i in range(n * 2 + 1):
-            xi = x - SYMBOL_WIDTH/2 + i * dx
-            yi = y + (SYMBOL_HEIGHT if i % 2 == 0 else -SYMBOL_HEIGHT)
-            pts.append((xi, yi))
-        xs, ys = zip(*pts)
+        i = np.arange(n * 2 + 1)
+        xs = x - SYMBOL_WIDTH/2 + i * dx
+        ys = np.where(i % 2 == 0, y + SYMBOL_HEIGHT, y - SYMBOL_HEIGHT)
         ax.plot(xs, ys, 'k-', lw=2)
     else:
         # generic rectangle
@@ -67,21 +83,19 @@ def draw_symbol(ax, comp, x, y):
             f"{comp.value}{comp.unit}", ha='center', fontsize=8)
 
 
-def draw_circuit(program, output_path):
+def draw_circuit(program, interp, output_path):
     """
     Draws the circuit using a rectangular loop for single-net, else orthogonal grid.
     """
-    nets = build_nets(program)
+    nets = build_nets(program, interp)
+    comp_by_name = {c.name: c for c in program.components}
     # Detect a simple 3‑component loop by number of components & connections
     if len(program.components) == 3 and len(program.connections) == 3:
         fig, ax = plt.subplots(figsize=(6,6))
         left, right = 1, 5
         top, bottom = 5, 1
-        # rails
-        ax.plot([left, right], [top, top], 'k-')
-        ax.plot([right, right], [top, bottom], 'k-')
-        ax.plot([right, left], [bottom, bottom], 'k-')
-        ax.plot([left, left], [bottom, top], 'k-')
+        # rails as one closed polyline
+        ax.plot([left, right, right, left, left], [top, top, bottom, bottom, top], 'k-')
         # place V1, R1, C1 in order around loop
         placements = [
             ('V1', (left, (top+bottom)/2)),
@@ -89,14 +103,10 @@ def draw_circuit(program, output_path):
             ('C1', (right, (top+bottom)/2)),
         ]
         for name, (x,y) in placements:
-            comp = next(c for c in program.components if c.name == name)
+            comp = comp_by_name[name]
             draw_symbol(ax, comp, x, y)
         # ground at bottom center
-        gx, gy = (left+right)/2, bottom
-        ax.vlines(gx, gy, gy-0.8, 'k')
-        ax.hlines(gy-0.8, gx-0.3, gx+0.3, 'k')
-        ax.hlines(gy-1.0, gx-0.2, gx+0.2, 'k')
-        ax.hlines(gy-1.2, gx-0.1, gx+0.1, 'k')
+        draw_grounds(ax, [(left+right)/2], [bottom])
         ax.axis('off')
         plt.tight_layout()
         plt.savefig(output_path, bbox_inches='tight')
@@ -106,19 +116,24 @@ def draw_circuit(program, output_path):
     # Orthogonal grid layout
     fig, ax = plt.subplots(figsize=(COMP_SPACING * 5, NET_SPACING * (len(nets)+1)))
     y_map = {nid: (len(nets)-i) * NET_SPACING for i, nid in enumerate(nets)}
+    # collect rail and ground coordinates, then draw each kind in one call
+    rail_ys, rail_ends = [], []
+    ground_xs, ground_ys = [], []
     for nid, endpoints in nets.items():
         y0 = y_map[nid]
-        ax.hlines(y0, 0, COMP_SPACING * len(endpoints), 'k', 1)
+        rail_ys.append(y0)
+        rail_ends.append(COMP_SPACING * len(endpoints))
         for idx, ep in enumerate(endpoints):
             x0 = COMP_SPACING * (idx + 0.5)
             if ep == 'ground':
-                ax.vlines(x0, y0, y0-0.8, 'k', 1)
-                ax.hlines(y0-0.8, x0-0.3, x0+0.3, 'k', 1)
-                ax.hlines(y0-1.0, x0-0.2, x0+0.2, 'k', 1)
-                ax.hlines(y0-1.2, x0-0.1, x0+0.1, 'k', 1)
+                ground_xs.append(x0)
+                ground_ys.append(y0)
             else:
-                comp = next(c for c in program.components if c.name == ep.component)
+                comp = comp_by_name[ep.component]
                 draw_symbol(ax, comp, x0, y0)
+    ax.hlines(rail_ys, 0, rail_ends, colors='k', linewidths=1)
+    if ground_xs:
+        draw_grounds(ax, ground_xs, ground_ys, linewidths=1)
     ax.set_xlim(0, COMP_SPACING * (max(len(e) for e in nets.values())+0.5))
     ax.set_ylim(-1.5, (len(nets)+1)*NET_SPACING)
     ax.axis('off')
@@ -142,8 +157,9 @@ def main():
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
-    Interpreter(program).run()
-    draw_circuit(program, args.output_file)
+    interp = Interpreter(program)
+    interp.run()
+    draw_circuit(program, interp, args.output_file)
 
 
 if __name__ == "__main__":
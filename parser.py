@@ -1,7 +1,11 @@
+import sys
 from typing import List
 from lexer import Token, TokenType
 from ast_nodes import ComponentDeclaration, ComponentTerminal, Connection, SimulationCommand, SimulationBlock, Subcircuit, Program
 
+# EOF sentinel returned past the end of the token list (line/col not really used for EOF)
+_EOF_TOKEN = Token(TokenType.EOF, '', -1, -1)
+
 class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
@@ -14,142 +18,146 @@ class Parser:
         if self.index < len(self.tokens):
             self.current = self.tokens[self.index]
         else:
-            # EOF sentinel (line/col not really used for EOF)
-            self.current = Token(TokenType.EOF, '', -1, -1)
+            self.current = _EOF_TOKEN
 
-    def consume(self, ttype: TokenType, value: str = None) -> Token:
-        if self.current.type == ttype and (value is None or self.current.value == value):
+    def consume(self, ttype: TokenType) -> Token:
+        if self.current.type is ttype:
             tok = self.current
             self.advance()
             return tok
         raise SyntaxError(
-            f"Expected {ttype.name}{' '+value if value else ''}, got {self.current.value!r} "
+            f"Expected {ttype.name}, got {self.current.value!r} "
             f"at line {self.current.line}, column {self.current.column}"
         )
 
     def parse(self) -> Program:
         components, connections, simulations, subcircuits = [], [], [], []
+        # leading token type -> (statement parser, list receiving the result)
+        statements = {
+            TokenType.COMPONENT:  (self.parse_component, components),
+            TokenType.CONNECT:    (self.parse_connection, connections),
+            TokenType.SIMULATE:   (self.parse_simulation, simulations),
+            TokenType.SUBCIRCUIT: (self.parse_subcircuit, subcircuits),
+            # Parse subcircuit instantiation: SubcktName InstanceName;
+            TokenType.IDENTIFIER: (self.parse_subcircuit_instance, components),
+        }
         while self.current.type != TokenType.EOF:
-            if self.current.type == TokenType.COMPONENT:
-                components.append(self.parse_component())
-            elif self.current.type == TokenType.CONNECT:
-                connections.append(self.parse_connection())
-            elif self.current.type == TokenType.SIMULATE:
-                simulations.append(self.parse_simulation())
-            elif self.current.type == TokenType.SUBCIRCUIT:
-                subcircuits.append(self.parse_subcircuit())
-            elif self.current.type == TokenType.IDENTIFIER:
-                # Parse subcircuit instantiation: SubcktName InstanceName;
-                components.append(self.parse_subcircuit_instance())
-            else:
+            statement = statements.get(self.current.type)
+            if statement is None:
                 raise SyntaxError(
                     f"Unexpected token {self.current.value!r} "
                     f"at line {self.current.line}, column {self.current.column}"
                 )
+            parse_statement, target = statement
+            target.append(parse_statement())
         return Program(components, connections, simulations, subcircuits)
 
     def parse_component(self) -> ComponentDeclaration:
         ctype = self.consume(TokenType.COMPONENT).value
         name  = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.SYMBOL, '(')
+        self.consume(TokenType.LPAREN)
         value = float(self.consume(TokenType.NUMBER).value)
         unit  = self.consume(TokenType.UNIT).value
-        self.consume(TokenType.SYMBOL, ')')
-        self.consume(TokenType.SYMBOL, ';')
+        self.consume(TokenType.RPAREN)
+        self.consume(TokenType.SEMICOLON)
         return ComponentDeclaration(ctype, name, value, unit)
 
     def parse_connection(self) -> Connection:
-        self.consume(TokenType.CONNECT)
-        self.consume(TokenType.SYMBOL, '(')
+        start = self.consume(TokenType.CONNECT)
+        self.consume(TokenType.LPAREN)
         endpoints = []
         while True:
-            if self.current.type == TokenType.IDENTIFIER:
+            tok = self.current
+            if tok.type is TokenType.IDENTIFIER:
                 # Look ahead: if next is dot, parse as terminal, else as node name
                 lookahead = self.tokens[self.index + 1]
-                if lookahead.value == '.':
+                if lookahead.type is TokenType.DOT:
                     # Parse hierarchical terminal
                     parts = [self.consume(TokenType.IDENTIFIER).value]
-                    while self.current.value == '.':
-                        self.consume(TokenType.SYMBOL, '.')
+                    while self.current.type is TokenType.DOT:
+                        self.consume(TokenType.DOT)
                         parts.append(self.consume(TokenType.IDENTIFIER).value)
                     if len(parts) < 2:
                         raise SyntaxError("Expected at least one dot in terminal reference")
-                    comp = '.'.join(parts[:-1])
+                    comp = sys.intern('.'.join(parts[:-1]))
                     term = parts[-1]
                     endpoints.append(ComponentTerminal(comp, term))
                 else:
                     # It's a node name
-                    endpoints.append(self.consume(TokenType.IDENTIFIER).value)
+                    endpoints.append(tok.value)
+                    self.advance()
             else:
                 # literal node name or 'ground'
-                endpoints.append(self.current.value)
+                endpoints.append(tok.value)
                 self.advance()
             # comma-separated?
-            if self.current.value == ',':
-                self.consume(TokenType.SYMBOL, ',')
+            if self.current.type is TokenType.COMMA:
+                self.advance()
                 continue
             break
-        self.consume(TokenType.SYMBOL, ')')
-        self.consume(TokenType.SYMBOL, ';')
+        self.consume(TokenType.RPAREN)
+        self.consume(TokenType.SEMICOLON)
         if len(endpoints) != 2:
             raise SyntaxError(
                 f"Connect statement must have exactly 2 endpoints, got {len(endpoints)} "
-                f"at line {self.current.line}, column {self.current.column}"
+                f"at line {start.line}, column {start.column}"
             )
         return Connection(endpoints)
 
     def parse_simulation(self) -> SimulationBlock:
         self.consume(TokenType.SIMULATE)
-        self.consume(TokenType.SYMBOL, '{')
+        self.consume(TokenType.LBRACE)
         commands: List[SimulationCommand] = []
-        while self.current.value != '}':
+        while self.current.type is not TokenType.RBRACE:
             stype = self.consume(TokenType.KEYWORD).value
             params = []
-            if self.current.value == '(':
-                self.consume(TokenType.SYMBOL, '(')
+            if self.current.type is TokenType.LPAREN:
+                self.advance()
                 while True:
-                    if self.current.type == TokenType.NUMBER:
+                    if self.current.type is TokenType.NUMBER:
                         params.append(float(self.consume(TokenType.NUMBER).value))
                     else:
                         params.append(self.consume(TokenType.KEYWORD).value)
-                    if self.current.value == ',':
-                        self.consume(TokenType.SYMBOL, ',')
+                    if self.current.type is TokenType.COMMA:
+                        self.advance()
                         continue
                     break
-                self.consume(TokenType.SYMBOL, ')')
-            self.consume(TokenType.SYMBOL, ';')
+                self.consume(TokenType.RPAREN)
+            self.consume(TokenType.SEMICOLON)
             commands.append(SimulationCommand(stype, params))
         # closing brace
-        self.consume(TokenType.SYMBOL, '}')
+        self.consume(TokenType.RBRACE)
         # consume optional semicolon after the block
-        if self.current.type == TokenType.SYMBOL and self.current.value == ';':
-            self.consume(TokenType.SYMBOL, ';')
+        if self.current.type is TokenType.SEMICOLON:
+            self.consume(TokenType.SEMICOLON)
         return SimulationBlock(commands)
 
     def parse_subcircuit(self) -> Subcircuit:
         self.consume(TokenType.SUBCIRCUIT)
         name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.SYMBOL, '{')
+        self.consume(TokenType.LBRACE)
         comps, conns, sims = [], [], []
-        while self.current.value != '}':
-            if self.current.type == TokenType.COMPONENT:
-                comps.append(self.parse_component())
-            elif self.current.type == TokenType.CONNECT:
-                conns.append(self.parse_connection())
-            elif self.current.type == TokenType.SIMULATE:
-                sims.append(self.parse_simulation())
-            else:
+        statements = {
+            TokenType.COMPONENT: (self.parse_component, comps),
+            TokenType.CONNECT:   (self.parse_connection, conns),
+            TokenType.SIMULATE:  (self.parse_simulation, sims),
+        }
+        while self.current.type is not TokenType.RBRACE:
+            statement = statements.get(self.current.type)
+            if statement is None:
                 raise SyntaxError(
                     f"Unexpected token {self.current.value!r} "
                     f"at line {self.current.line}, column {self.current.column}"
                 )
-        self.consume(TokenType.SYMBOL, '}')
-        self.consume(TokenType.SYMBOL, ';')
+            parse_statement, target = statement
+            target.append(parse_statement())
+        self.consume(TokenType.RBRACE)
+        self.consume(TokenType.SEMICOLON)
         return Subcircuit(name, comps, conns, sims)
 
     def parse_subcircuit_instance(self) -> ComponentDeclaration:
         subckt_type = self.consume(TokenType.IDENTIFIER).value
         name = self.consume(TokenType.IDENTIFIER).value
-        self.consume(TokenType.SYMBOL, ';')
+        self.consume(TokenType.SEMICOLON)
         # Use a special type or flag to indicate this is a subcircuit instance
         return ComponentDeclaration(subckt_type, name, 0, '')